@@ -7,15 +7,27 @@ either threads (for I/O-bound tasks) or processes (for CPU-bound tasks).
 
 __version__ = "1.1.10"
 
-from py_parallelizer.executor import ParallelExecutor
-from py_parallelizer.executors.multiprocess import MultiprocessExecutor
-from py_parallelizer.executors.threader import ThreadedExecutor
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from py_parallelizer.utils.input_parsing import (
     create_batch_kwargs,
     create_batches,
     flatten_results,
 )
 
+if TYPE_CHECKING:
+    from py_parallelizer.executor import ParallelExecutor
+    from py_parallelizer.executors.multiprocess import MultiprocessExecutor
+    from py_parallelizer.executors.threader import ThreadedExecutor
+
+# The executors pull in tqdm and multiprocessing, so they are imported on first use
+_LAZY_IMPORTS = {
+    "ParallelExecutor": "py_parallelizer.executor",
+    "ThreadedExecutor": "py_parallelizer.executors.threader",
+    "MultiprocessExecutor": "py_parallelizer.executors.multiprocess",
+}
+
 __all__ = [
     "ParallelExecutor",
     "ThreadedExecutor",
@@ -24,3 +36,13 @@ __all__ = [
     "flatten_results",
     "create_batch_kwargs",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        return getattr(import_module(_LAZY_IMPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
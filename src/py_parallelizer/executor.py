@@ -1,6 +1,8 @@
 """Public API for parallel execution."""
 
 from collections.abc import Callable
+from multiprocessing.pool import Pool
+from typing import Literal
 
 from py_parallelizer.executors.multiprocess import MultiprocessExecutor
 from py_parallelizer.executors.threader import ThreadedExecutor
@@ -19,11 +21,35 @@ class ParallelExecutor:
         n_workers: int | None = None,
         results_func=None,
         verbose: bool = True,
+        persistent_pool: bool = False,
+        results_func_in_worker: bool = False,
+        max_tasks_per_child: int | None = None,
+        cpu_affinity: bool = False,
+        positional: bool = False,
+        worker_init: Callable | None = None,
+        worker_init_args: tuple = (),
+        start_method: Literal["fork", "forkserver", "spawn"] | None = None,
+        fail_fast: bool = True,
+        chunksize: int | None = None,
+        pool: Pool | None = None,
     ) -> None:
         self.func = func
         self.n_workers = n_workers
         self.results_func = results_func
         self.verbose = verbose
+        self.persistent_pool = persistent_pool
+        self.results_func_in_worker = results_func_in_worker
+        self.max_tasks_per_child = max_tasks_per_child
+        self.cpu_affinity = cpu_affinity
+        self.positional = positional
+        self.worker_init = worker_init
+        self.worker_init_args = worker_init_args
+        self.start_method = start_method
+        self.fail_fast = fail_fast
+        self.chunksize = chunksize
+        self.pool = pool
+        # Failed tasks of the last run as {task_index: exception}, for fail_fast=False
+        self.errors: dict[int, Exception] = {}
 
     def run_threaded(self, **kwargs) -> tuple[list, bool]:
         """Run the function in parallel using threads.
@@ -36,8 +62,13 @@ class ParallelExecutor:
             n_workers=self.n_workers,
             verbose=self.verbose,
             results_func=self.results_func,
+            positional=self.positional,
+            worker_init=self.worker_init,
+            worker_init_args=self.worker_init_args,
+            fail_fast=self.fail_fast,
+            chunksize=self.chunksize,
         )
-        return executor.execute(**kwargs)
+        return self._execute(executor, **kwargs)
 
     def run_multiprocess(self, **kwargs) -> tuple[list, bool]:
         """Run the function in parallel using multiprocessing.
@@ -50,5 +81,24 @@ class ParallelExecutor:
             n_workers=self.n_workers,
             verbose=self.verbose,
             results_func=self.results_func,
+            persistent_pool=self.persistent_pool,
+            results_func_in_worker=self.results_func_in_worker,
+            max_tasks_per_child=self.max_tasks_per_child,
+            cpu_affinity=self.cpu_affinity,
+            positional=self.positional,
+            worker_init=self.worker_init,
+            worker_init_args=self.worker_init_args,
+            start_method=self.start_method,
+            fail_fast=self.fail_fast,
+            chunksize=self.chunksize,
+            pool=self.pool,
         )
-        return executor.execute(**kwargs)
+        return self._execute(executor, **kwargs)
+
+    def _execute(
+        self, executor: ThreadedExecutor | MultiprocessExecutor, **kwargs
+    ) -> tuple[list, bool]:
+        try:
+            return executor.execute(**kwargs)
+        finally:
+            self.errors = executor.errors
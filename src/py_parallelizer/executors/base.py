@@ -1,9 +1,10 @@
 """Base classes for parallel execution strategies."""
 
+import os
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Iterator, Sized
+from functools import cache
 
-import psutil
 from tqdm import tqdm
 
 from py_parallelizer.utils.logging import setup_logger
@@ -11,6 +12,27 @@ from py_parallelizer.utils.logging import setup_logger
 logger = setup_logger(__name__)
 
 
+@cache
+def _cpu_count() -> int:
+    # The affinity mask honours taskset/cgroup CPU limits, unlike the total count
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _default_chunksize(total_jobs: int, n_workers: int) -> int:
+    """Same heuristic as `multiprocessing.Pool.map`: ~4 chunks per worker."""
+    chunksize, extra = divmod(total_jobs, n_workers * 4)
+    return chunksize + 1 if extra else max(chunksize, 1)
+
+
+def _call(func: Callable, keys: tuple[str, ...] | None, values: tuple):
+    # `keys` is None when the arguments are passed positionally
+    if keys is None:
+        return func(*values)
+    return func(**dict(zip(keys, values, strict=True)))
+
+
 class BaseParallelExecutor(ABC):
     """Abstract base class for parallel execution strategies."""
 
@@ -21,16 +43,34 @@ class BaseParallelExecutor(ABC):
         pbar_color: str,
         results_func=None,
         verbose: bool = True,
+        positional: bool = False,
+        worker_init: Callable | None = None,
+        worker_init_args: tuple = (),
+        fail_fast: bool = True,
+        chunksize: int | None = None,
     ) -> None:
+        if chunksize is not None and chunksize < 1:
+            raise ValueError(f"chunksize must be positive, got {chunksize}")
         self.func = func
-        self.n_workers = psutil.cpu_count() if n_workers is None else n_workers
+        self.chunksize = chunksize
+        self.fail_fast = fail_fast
+        self.positional = positional
+        self.worker_init = worker_init
+        self.worker_init_args = worker_init_args
+        self.n_workers = _cpu_count() if n_workers is None else n_workers
         self.interrupt = False
         self.verbose = verbose
         self.pbar = None
         self.pbar_color = pbar_color
         self.pbar_desc: str = "Running code concurrently"
         self.results_func = results_func
+        self.results_func_in_worker = False
+        self.results: list = []
+        self.n_collected = 0
         self.first_error: Exception | None = None
+        self.errors: dict[int, Exception] = {}
+        # An error that stopped a worker outside of any task, e.g. in worker_init
+        self.worker_error: BaseException | None = None
         logger.debug(
             "%s processing [%s] using [%s] workers...",
             self.__class__.__name__,
@@ -39,15 +79,75 @@ class BaseParallelExecutor(ABC):
         )
 
     @staticmethod
-    def _format_args(**kwargs) -> list[dict]:
-        """Convert keyword arguments into a list of dicts for each task."""
-        if not kwargs:
-            return []
-        kwds = []
-        arguments = list(kwargs.keys())
-        for _, args in enumerate(zip(*kwargs.values(), strict=True)):
-            kwds.append({arg: args[arg_idx] for arg_idx, arg in enumerate(arguments)})
-        return kwds
+    def _as_columns(**kwargs) -> dict:
+        """Materialize one-shot iterables so every argument has a known length."""
+        return {
+            key: values if isinstance(values, Sized) else list(values)
+            for key, values in kwargs.items()
+        }
+
+    @staticmethod
+    def _count_jobs(**kwargs) -> int:
+        """Return the number of tasks, checking all arguments have the same length."""
+        lengths = {len(values) for values in kwargs.values()}
+        if len(lengths) > 1:
+            raise ValueError(
+                f"All arguments must have the same length, got {sorted(lengths)}"
+            )
+        return lengths.pop() if lengths else 0
+
+    def _chunksize(self, total_jobs: int) -> int:
+        return self.chunksize or _default_chunksize(total_jobs, self.n_workers)
+
+    def _task_keys(self, kwargs: dict) -> tuple[str, ...] | None:
+        """Argument names sent with each chunk, or None for positional calls."""
+        return None if self.positional else tuple(kwargs)
+
+    @staticmethod
+    def _iter_values(**kwargs) -> Iterator[tuple]:
+        """Lazily yield the argument values for each task, in keyword order."""
+        return zip(*kwargs.values(), strict=True)
+
+    def _start_run(self, total_jobs: int) -> None:
+        self.first_error = None
+        self.errors = {}
+        self.worker_error = None
+        self.n_collected = 0
+        self.results = [None] * total_jobs
+        self.init_pbar(total=total_jobs)
+
+    def _runs_inline(self, total_jobs: int) -> bool:
+        # Starting workers costs more than a single task; worker_init callers expect
+        # their task to run in an initialized worker, so they get one unless there
+        # is nothing to run at all
+        if total_jobs == 0:
+            return True
+        return total_jobs == 1 and self.worker_init is None
+
+    def _store_result(self, idx: int, value, error: Exception | None = None) -> None:
+        if error is not None:
+            self._record_error(idx, error)
+            return
+        if self.results_func and not self.results_func_in_worker:
+            value = self.results_func(value, process_index=idx)
+        self.results[idx] = value
+        self.n_collected += 1
+        self.pbar_update()
+
+    def _record_error(self, idx: int, error: Exception) -> None:
+        logger.error("Task %s failed: %r", idx, error)
+        self.errors[idx] = error
+        if self.first_error is None:
+            self.first_error = error
+        self.pbar_update()
+
+    def _raise_first_error(self) -> None:
+        # A worker that failed to start leaves tasks unrun, so this always raises
+        if self.worker_error is not None:
+            raise self.worker_error
+        # Without fail_fast the errors are only reported through `self.errors`
+        if self.fail_fast and self.first_error is not None:
+            raise self.first_error
 
     def init_pbar(self, total: int) -> None:
         if self.verbose:
@@ -61,8 +161,9 @@ class BaseParallelExecutor(ABC):
 
     def pbar_update(self) -> None:
         if self.pbar:
+            # tqdm throttles redraws to `mininterval`; forcing a refresh per task
+            # makes terminal writes the bottleneck for short tasks
             self.pbar.update()
-            self.pbar.refresh()
 
     def pbar_close(self) -> None:
         if self.pbar:
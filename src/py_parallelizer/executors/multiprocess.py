@@ -1,16 +1,114 @@
 """Multiprocessing-based parallel executor implementation."""
 
+import atexit
 import multiprocessing as mp
+import os
 import signal
-import time
-from collections.abc import Callable
+import threading
+from collections.abc import Callable, Iterator
+from functools import partial
+from multiprocessing.pool import Pool
 from typing import Literal
 
-from py_parallelizer.executors.base import BaseParallelExecutor
+from py_parallelizer.executors.base import (
+    BaseParallelExecutor,
+    _call,
+)
 from py_parallelizer.utils.logging import setup_logger
 
 logger = setup_logger(__name__)
 
+# Pools shared by executors created with `persistent_pool=True`, keyed by their
+# creation arguments
+_POOL_CACHE: dict[tuple, mp.Pool] = {}
+_POOL_CACHE_LOCK = threading.Lock()
+
+# Set in a worker whose worker_init raised. The pool would replace a worker that
+# died in its initializer with another one failing the same way, so the worker stays
+# up and hands the error back instead of running tasks.
+_worker_init_error: BaseException | None = None
+
+
+def _init_worker(
+    cpu_affinity: bool = False,
+    worker_init: Callable | None = None,
+    worker_init_args: tuple = (),
+) -> None:
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if cpu_affinity and hasattr(os, "sched_setaffinity"):
+        # The last identity entry counts up from 1 within this worker's own pool, also
+        # for workers replacing retired ones; earlier entries belong to parent pools
+        cpus = sorted(os.sched_getaffinity(0))
+        slot = mp.current_process()._identity[-1] - 1
+        os.sched_setaffinity(0, {cpus[slot % len(cpus)]})
+    if worker_init:
+        global _worker_init_error
+        try:
+            worker_init(*worker_init_args)
+        except BaseException as e:
+            _worker_init_error = e
+
+
+def _create_pool(
+    n_workers: int,
+    max_tasks_per_child: int | None,
+    cpu_affinity: bool,
+    worker_init: Callable | None,
+    worker_init_args: tuple,
+    start_method: str | None,
+) -> mp.Pool:
+    return mp.get_context(start_method).Pool(
+        n_workers,
+        _init_worker,
+        (cpu_affinity, worker_init, worker_init_args),
+        maxtasksperchild=max_tasks_per_child,
+    )
+
+
+def _get_shared_pool(*pool_args) -> mp.Pool:
+    with _POOL_CACHE_LOCK:
+        if pool_args not in _POOL_CACHE:
+            logger.debug("Creating shared process pool %s", pool_args)
+            _POOL_CACHE[pool_args] = _create_pool(*pool_args)
+        return _POOL_CACHE[pool_args]
+
+
+def _evict_shared_pool(pool: mp.Pool) -> None:
+    with _POOL_CACHE_LOCK:
+        for key, cached_pool in list(_POOL_CACHE.items()):
+            if cached_pool is pool:
+                del _POOL_CACHE[key]
+
+
+@atexit.register
+def _close_shared_pools() -> None:
+    with _POOL_CACHE_LOCK:
+        for pool in _POOL_CACHE.values():
+            pool.terminate()
+            pool.join()
+        _POOL_CACHE.clear()
+
+
+def _run_task(
+    func: Callable,
+    keys: tuple[str, ...] | None,
+    results_func: Callable | None,
+    task: tuple[int, tuple],
+) -> tuple:
+    # Errors are returned instead of raised: with chunked dispatch a raised error
+    # would discard the results of every other task in the same chunk.
+    idx, values = task
+    if _worker_init_error is not None:
+        # No task index: this is not the task's own error
+        return None, None, _worker_init_error
+    try:
+        result = _call(func, keys, values)
+        if results_func:
+            result = results_func(result, process_index=idx)
+        return idx, result, None
+    except Exception as e:
+        return idx, None, e
+
 
 class MultiprocessExecutor(BaseParallelExecutor):
     """Executor that uses multiprocessing for parallel execution."""
@@ -22,102 +120,175 @@ class MultiprocessExecutor(BaseParallelExecutor):
         verbose: bool = True,
         pbar_color: str = "red",
         results_func=None,
+        persistent_pool: bool = False,
+        results_func_in_worker: bool = False,
+        max_tasks_per_child: int | None = None,
+        cpu_affinity: bool = False,
+        positional: bool = False,
+        worker_init: Callable | None = None,
+        worker_init_args: tuple = (),
+        start_method: Literal["fork", "forkserver", "spawn"] | None = None,
+        fail_fast: bool = True,
+        chunksize: int | None = None,
+        pool: Pool | None = None,
     ) -> None:
+        if pool is not None:
+            # These configure the workers of a pool this executor starts itself
+            pool_options = {
+                "n_workers": n_workers is not None,
+                "persistent_pool": persistent_pool,
+                "max_tasks_per_child": max_tasks_per_child is not None,
+                "cpu_affinity": cpu_affinity,
+                "worker_init": worker_init is not None,
+                "start_method": start_method is not None,
+            }
+            if conflicting := [name for name, is_set in pool_options.items() if is_set]:
+                raise ValueError(f"pool cannot be combined with {conflicting}")
         super().__init__(
             func=func,
             n_workers=n_workers,
             pbar_color=pbar_color,
             verbose=verbose,
             results_func=results_func,
+            positional=positional,
+            worker_init=worker_init,
+            worker_init_args=worker_init_args,
+            fail_fast=fail_fast,
+            chunksize=chunksize,
+        )
+        # A persistent pool outlives this executor so later executors of the same
+        # size skip the cost of starting worker processes.
+        self.persistent_pool = persistent_pool
+        # Opt-in because results_func is documented to run in the main process
+        self.results_func_in_worker = results_func_in_worker
+        self._pool_args = (
+            self.n_workers,
+            max_tasks_per_child,
+            cpu_affinity,
+            worker_init,
+            worker_init_args,
+            start_method,
         )
-        self.pool: mp.Pool = mp.Pool(self.n_workers, self._init_worker)
-        self.processes: list = []
-        self.results: list = []
+        # A pool passed in by the caller is used as is and never closed here
+        self._external_pool = pool
+        # Started on first use, so runs without tasks never pay for it
+        self.pool: mp.Pool | None = None
         self.pbar_desc = f"Running code in parallel [{self.n_workers} workers]"
 
-    @staticmethod
-    def _init_worker() -> None:
-        signal.signal(signal.SIGINT, signal.SIG_IGN)
-
     def execute(self, **kwargs) -> tuple[list, bool]:
-        self.first_error = None
-        keywordargs = self._format_args(**kwargs)
-        total_jobs = len(keywordargs)
-        self.init_pbar(total=total_jobs)
+        kwargs = self._as_columns(**kwargs)
+        total_jobs = self._count_jobs(**kwargs)
+        self._start_run(total_jobs)
+        chunksize = self._chunksize(total_jobs)
         logger.debug(
-            "Creating process pool with %s workers for %s jobs",
-            self.n_workers,
+            "Submitting %s jobs to %s workers in chunks of %s",
             total_jobs,
+            self.n_workers,
+            chunksize,
         )
 
-        self.processes = []
-        self.results = [None] * total_jobs
-        logger.debug("Submitting tasks to process pool")
-        self.processes = [
-            self.pool.apply_async(self.func, kwds=kwds) for kwds in keywordargs
-        ]
-        logger.debug("Submitted %s tasks", len(self.processes))
+        # Argument names travel once per chunk; each task only carries values
+        run_task = partial(
+            _run_task,
+            self.func,
+            self._task_keys(kwargs),
+            self.results_func if self.results_func_in_worker else None,
+        )
+        tasks = enumerate(self._iter_values(**kwargs))
         try:
-            self._collect_results()
+            if self._runs_inline(total_jobs):
+                results_iter = map(run_task, tasks)
+            else:
+                results_iter = self._open_pool(total_jobs).imap_unordered(
+                    run_task, tasks, chunksize=chunksize
+                )
+            self._collect_results(results_iter)
         except KeyboardInterrupt:
             self._cleanup_on_interrupt()
+        except Exception:
+            self._cleanup_on_error()
+            raise
         else:
             self._cleanup_on_done()
         self.pbar_close()
         logger.debug(
             "Multiprocess execution done: %s results collected",
-            len([r for r in self.results if r is not None]),
+            self.n_collected,
         )
 
-        # Re-raise the first error encountered by any worker
-        if self.first_error is not None:
-            raise self.first_error
-
+        self._raise_first_error()
         return self.results, self.interrupt
 
-    def _collect_ready_results(self) -> None:
-        for proc_idx, process in enumerate(self.processes):
-            if process and process.ready():
-                try:
-                    results = process.get(timeout=0)
-                    if self.results_func:
-                        results = self.results_func(results, process_index=proc_idx)
-                    self.results[proc_idx] = results
-                    self.processes[proc_idx] = None
-                    self.pbar_update()
-                except Exception as e:
-                    # Store first error encountered
-                    if self.first_error is None:
-                        self.first_error = e
-                    self.processes[proc_idx] = None
-
-    def _collect_results(self) -> None:
+    def _runs_inline(self, total_jobs: int) -> bool:
+        # Even a single task runs in a worker, so it keeps the process isolation and
+        # the pool options, and an unpicklable func fails the same for any task count
+        return total_jobs == 0
+
+    def _collect_results(self, results_iter: Iterator[tuple]) -> None:
         logger.debug("Starting result collection from processes")
-        finished = False
-        while not finished:
-            self._collect_ready_results()
-            if all(proc is None for proc in self.processes):
-                finished = True
-            else:
-                time.sleep(0.3)
+        for idx, result, error in results_iter:
+            if idx is None:
+                logger.error("Worker initialization failed: %r", error)
+                self.worker_error = error
+                break
+            self._store_result(idx, result, error)
+            if error is not None and self.fail_fast:
+                break
         logger.debug("Process result collection complete")
 
+    def _open_pool(self, total_jobs: int) -> mp.Pool:
+        if self.pool is None:
+            if self._external_pool is not None:
+                self.pool = self._external_pool
+            elif self.persistent_pool:
+                self.pool = _get_shared_pool(*self._pool_args)
+            else:
+                # Processes beyond the number of tasks would start only to sit idle
+                n_workers = min(self.n_workers, total_jobs)
+                self.pool = _create_pool(n_workers, *self._pool_args[1:])
+        return self.pool
+
     def _cleanup_on_interrupt(self) -> None:
-        logger.warning("Caught KeyboardInterrupt, collecting completed results...")
-        self._collect_ready_results()
+        logger.warning("Caught KeyboardInterrupt, keeping completed results...")
         self.interrupt = True
-        for idx, _ in enumerate(self.processes):
-            self.processes[idx] = None
-        self.processes = []
         self._clean_pool(how="terminate")
         logger.warning("Caught KeyboardInterrupt, Exiting...")
 
+    def _cleanup_on_error(self) -> None:
+        # e.g. a main-process results_func raised: stop the run before re-raising
+        logger.debug("Run failed, stopping the process pool")
+        if not self.persistent_pool:
+            self._clean_pool(how="terminate")
+        self.pbar_close()
+
     def _cleanup_on_done(self) -> None:
-        self._clean_pool(how="close")
+        if self.worker_error is not None:
+            # A pool with failed workers is not reused
+            self._clean_pool(how="terminate")
+        elif self.persistent_pool:
+            # Kept for later executors, also after a fail-fast error: the healthy
+            # workers just finish the queued tasks nobody collects
+            pass
+        elif self.fail_fast and self.errors:
+            # Don't wait for the queued tasks of a run that is going to raise
+            self._clean_pool(how="terminate")
+        else:
+            self._clean_pool(how="close")
         logger.debug("Cleanup on done complete")
 
     def _clean_pool(self, how: Literal["close", "terminate"]) -> None:
-        if self.pool:
+        if self.pool is self._external_pool:
+            self.pool = None
+        elif self.pool and self.persistent_pool:
+            if how == "terminate":
+                # Other executors may be in the middle of a run on a shared pool, so
+                # it is retired instead: it finishes their tasks, then its workers
+                # exit, and later executors get a new pool
+                logger.debug("Retiring shared process pool")
+                _evict_shared_pool(self.pool)
+                self.pool.close()
+            self.pool = None
+        elif self.pool:
             if how == "terminate":
                 logger.debug("Terminating process pool")
                 self.pool.terminate()
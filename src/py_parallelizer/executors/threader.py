@@ -1,14 +1,29 @@
 """Threading-based parallel executor implementation."""
 
 import threading
-from collections.abc import Callable
-from queue import Queue
-
-from py_parallelizer.executors.base import BaseParallelExecutor
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.thread import BrokenThreadPool
+from itertools import islice
+from queue import Empty, SimpleQueue
+
+from py_parallelizer.executors.base import (
+    BaseParallelExecutor,
+    _call,
+)
 from py_parallelizer.utils.logging import setup_logger
 
 logger = setup_logger(__name__)
 
+# Put on the results queue by a worker that stops before finishing its chunk, so the
+# collector does not wait for results that will never arrive
+_STOPPED = object()
+
+
+def _iter_chunks(tasks: Iterator, chunksize: int) -> Iterator[list]:
+    while chunk := list(islice(tasks, chunksize)):
+        yield chunk
+
 
 class ThreadedExecutor(BaseParallelExecutor):
     """Executor that uses threading for parallel execution."""
@@ -20,6 +35,11 @@ class ThreadedExecutor(BaseParallelExecutor):
         verbose: bool = True,
         pbar_color: str = "blue",
         results_func=None,
+        positional: bool = False,
+        worker_init: Callable | None = None,
+        worker_init_args: tuple = (),
+        fail_fast: bool = True,
+        chunksize: int | None = None,
     ) -> None:
         super().__init__(
             func=func,
@@ -27,141 +47,176 @@ class ThreadedExecutor(BaseParallelExecutor):
             pbar_color=pbar_color,
             verbose=verbose,
             results_func=results_func,
+            positional=positional,
+            worker_init=worker_init,
+            worker_init_args=worker_init_args,
+            fail_fast=fail_fast,
+            chunksize=chunksize,
         )
-        self.task_queue: Queue = Queue()
-        self.results_queue: Queue = Queue()
+        self.results_queue: SimpleQueue = SimpleQueue()
         self.stop_event = threading.Event()
-        self.threads: list[threading.Thread] = []
-        self.results: list = []
+        self.pool: ThreadPoolExecutor | None = None
         self.pbar_desc = f"Running code in threads [{self.n_workers} workers]"
 
-    def _worker(self) -> None:
-        thread_name = threading.current_thread().name
-        logger.debug("[%s] Worker started", thread_name)
-        while True:
-            item = self.task_queue.get()
-            if item is None or self.stop_event.is_set():
-                logger.debug("[%s] Worker stopping", thread_name)
-                self.results_queue.put("DONE")
-                break
-            try:
-                idx, kwds = item
-                logger.debug("[%s] Processing task %s", thread_name, idx)
-                result = self.func(**kwds)
-                self.results_queue.put((idx, result))
-            except Exception as e:
-                logger.error("[%s] Failed processing task %s: %s", thread_name, idx, e)
-                # Store first error and signal workers to stop
-                if self.first_error is None:
-                    self.first_error = e
-                    self.stop_event.set()
-                self.results_queue.put((idx, None))
-                self.results_queue.put("DONE")
-                break
+    def _init_worker(self) -> None:
+        try:
+            self.worker_init(*self.worker_init_args)
+        except BaseException as e:
+            logger.error("Worker initialization failed: %r", e)
+            if self.worker_error is None:
+                self.worker_error = e
+            self.stop_event.set()
+            # Breaks the pool, which fails the chunks still waiting to run
+            raise
+
+    def _on_chunk_done(self, future: Future) -> None:
+        # A chunk that never ran or died outside a task posts no results itself
+        if future.cancelled():
+            self.results_queue.put(_STOPPED)
+            return
+        error = future.exception()
+        if error is not None:
+            if self.worker_error is None:
+                self.worker_error = error
+            self.results_queue.put(_STOPPED)
+
+    def _run_chunk(
+        self, keys: tuple[str, ...] | None, chunk: list[tuple[int, tuple]]
+    ) -> None:
+        finished = False
+        try:
+            for idx, values in chunk:
+                if self.stop_event.is_set():
+                    return
+                try:
+                    result = _call(self.func, keys, values)
+                except Exception as e:
+                    self.results_queue.put((idx, None, e))
+                    if self.fail_fast:
+                        self.stop_event.set()
+                        return
+                    continue
+                self.results_queue.put((idx, result, None))
+            finished = True
+        finally:
+            # Also when func raises a BaseException, which ends the whole chunk
+            if not finished:
+                self.results_queue.put(_STOPPED)
 
     def execute(self, **kwargs) -> tuple[list, bool]:
-        self.first_error = None
         self.stop_event.clear()
-        keywordargs = self._format_args(**kwargs)
-        total_jobs = len(keywordargs)
-        self.init_pbar(total=total_jobs)
+        kwargs = self._as_columns(**kwargs)
+        total_jobs = self._count_jobs(**kwargs)
+        self._start_run(total_jobs)
+        chunksize = self._chunksize(total_jobs)
         logger.debug(
-            "Starting %s worker threads for %s jobs", self.n_workers, total_jobs
+            "Starting %s worker threads for %s jobs (chunksize %s)",
+            self.n_workers,
+            total_jobs,
+            chunksize,
         )
 
-        self.threads = []
-        self.results = [None] * total_jobs
-
-        for _ in range(self.n_workers):
-            thread = threading.Thread(target=self._worker)
-            thread.start()
-            self.threads.append(thread)
-
-        logger.debug("Enqueuing %s tasks", total_jobs)
-        for idx, kwds in enumerate(keywordargs):
-            self.task_queue.put((idx, kwds))
-
-        logger.debug("Sending stop signals to workers")
-        for _ in range(self.n_workers):
-            self.task_queue.put(None)
-
+        keys = self._task_keys(kwargs)
+        tasks = enumerate(self._iter_values(**kwargs))
         try:
-            self._collect_results()
+            if self._runs_inline(total_jobs):
+                self._run_inline(keys, tasks)
+            else:
+                self._submit_chunks(keys, tasks, chunksize)
+                self._collect_results(total_jobs)
         except KeyboardInterrupt:
             self._cleanup_on_interrupt()
+        except Exception:
+            self._cleanup_on_error()
+            raise
         else:
             self._cleanup_on_done()
         self.pbar_close()
         logger.debug(
             "Threaded execution done: %s results collected",
-            len([r for r in self.results if r is not None]),
+            self.n_collected,
         )
 
-        # Re-raise the first error encountered by any worker
-        if self.first_error is not None:
-            raise self.first_error
-
+        self._raise_first_error()
         return self.results, self.interrupt
 
-    def _collect_ready_results(self) -> None:
-        while not self.results_queue.empty():
+    def _runs_inline(self, total_jobs: int) -> bool:
+        # A single worker thread runs the tasks in order anyway, so the calling
+        # thread can do the same without the pool and the results queue
+        if self.n_workers == 1 and self.worker_init is None:
+            return True
+        return super()._runs_inline(total_jobs)
+
+    def _run_inline(self, keys: tuple[str, ...] | None, tasks: Iterator) -> None:
+        for idx, values in tasks:
+            try:
+                result = _call(self.func, keys, values)
+            except Exception as e:
+                self._store_result(idx, None, e)
+                if self.fail_fast:
+                    break
+                continue
+            self._store_result(idx, result)
+
+    def _submit_chunks(
+        self, keys: tuple[str, ...] | None, tasks: Iterator, chunksize: int
+    ) -> None:
+        self.pool = ThreadPoolExecutor(
+            max_workers=self.n_workers,
+            initializer=self._init_worker if self.worker_init else None,
+        )
+        for chunk in _iter_chunks(tasks, chunksize):
+            try:
+                future = self.pool.submit(self._run_chunk, keys, chunk)
+            except BrokenThreadPool:
+                # A worker failed to initialize while chunks were still submitted
+                self.results_queue.put(_STOPPED)
+                break
+            future.add_done_callback(self._on_chunk_done)
+
+    def _collect_ready_results(self, keep: bool = True) -> None:
+        while True:
             try:
-                result = self.results_queue.get_nowait()
-                if not (isinstance(result, str) and result == "DONE"):
-                    idx, value = result
-                    if self.results_func:
-                        value = self.results_func(value, process_index=idx)
-                    self.results[idx] = value
-                    self.pbar_update()
-            except Exception:
+                item = self.results_queue.get_nowait()
+            except Empty:
                 break
+            if keep and item is not _STOPPED:
+                self._store_result(*item)
 
-    def _collect_results(self) -> None:
+    def _collect_results(self, total_jobs: int) -> None:
         logger.debug("Starting result collection")
-        finished_workers = 0
-        while finished_workers < self.n_workers:
-            result = self.results_queue.get()
-            if isinstance(result, str) and result == "DONE":
-                finished_workers += 1
-                logger.debug(
-                    "Worker finished (%s/%s)", finished_workers, self.n_workers
-                )
-            else:
-                idx, value = result
-                if self.results_func:
-                    value = self.results_func(value, process_index=idx)
-                self.results[idx] = value
-                self.pbar_update()
+        for _ in range(total_jobs):
+            item = self.results_queue.get()
+            if item is _STOPPED:
+                break
+            self._store_result(*item)
         logger.debug("Result collection complete")
 
     def _cleanup_on_interrupt(self) -> None:
         logger.warning("Caught KeyboardInterrupt, collecting completed results...")
-        self._collect_ready_results()
         self.interrupt = True
         self.stop_event.set()
-        self._drain_task_queue()
-        self._wait_for_threads()
+        self._shutdown_pool()
         logger.warning("Caught KeyboardInterrupt, Exiting...")
 
+    def _cleanup_on_error(self) -> None:
+        # e.g. results_func raised: stop the run and leave nothing on the queue for
+        # the next one before re-raising
+        logger.debug("Run failed, stopping the worker threads")
+        self.stop_event.set()
+        self._shutdown_pool(keep_results=False)
+        self.pbar_close()
+
     def _cleanup_on_done(self) -> None:
-        self._wait_for_threads()
+        self._shutdown_pool()
         logger.debug("Cleanup on done complete")
 
-    def _drain_task_queue(self) -> None:
-        drained_count = 0
-        while not self.task_queue.empty():
-            try:
-                self.task_queue.get_nowait()
-                drained_count += 1
-            except Exception:
-                pass
-        logger.debug("Drained %s tasks from queue", drained_count)
-        logger.debug("Sending %s stop sentinels", self.n_workers)
-        for _ in range(self.n_workers):
-            self.task_queue.put(None)
-
-    def _wait_for_threads(self) -> None:
+    def _shutdown_pool(self, keep_results: bool = True) -> None:
         logger.debug("Waiting for all threads to complete")
-        for thread in self.threads:
-            thread.join()
-        self.threads = []
+        if self.pool is not None:
+            # After an interrupt or fail-fast error, drop the chunks no worker has
+            # started yet; running ones stop at their next task
+            self.pool.shutdown(wait=True, cancel_futures=self.stop_event.is_set())
+            self.pool = None
+        # Keep what finished after collection stopped and leave the queue empty
+        self._collect_ready_results(keep=keep_results)
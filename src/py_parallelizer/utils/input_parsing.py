@@ -1,21 +1,39 @@
 """Utility functions for batching and result processing."""
 
+from collections.abc import Sequence
+from itertools import chain, pairwise
 
-def create_batches(data: list, n_batches: int) -> list[list]:
+
+def _batch_bounds(n_items: int, n_batches: int) -> list[tuple[int, int]]:
+    if n_batches <= 0:
+        raise ValueError("n_batches must be positive")
+
+    # Limit batches to the number of items; the first `remainder` batches get one
+    # extra item each
+    n_batches = min(n_batches, n_items)
+    size, remainder = divmod(n_items, n_batches)
+    edges = [i * size + min(i, remainder) for i in range(n_batches + 1)]
+    return list(pairwise(edges))
+
+
+def create_batches(data: Sequence, n_batches: int) -> list[Sequence]:
     """
     Split data into n roughly equal batches.
 
+    Batches are slices of data, so they keep its type: lists give lists, and
+    NumPy arrays give views without copying.
+
     Parameters
     ----------
-    data : list
-        The data to split into batches.
+    data : Sequence
+        The data to split into batches, e.g. a list or a NumPy array.
     n_batches : int
         The number of batches to create.
 
     Returns
     -------
-    list[list]
-        A list of batches, where each batch is a list of items.
+    list[Sequence]
+        A list of batches, where each batch is a slice of data.
 
     Examples
     --------
@@ -28,28 +46,11 @@ def create_batches(data: list, n_batches: int) -> list[list]:
     >>> create_batches([], 3)
     []
     """
-    if not data:
+    # len() rather than truthiness, which is ambiguous for arrays
+    if len(data) == 0:
         return []
 
-    if n_batches <= 0:
-        raise ValueError("n_batches must be positive")
-
-    # Limit batches to data length
-    n_batches = min(n_batches, len(data))
-
-    batch_size = len(data) // n_batches
-    remainder = len(data) % n_batches
-    batches = []
-    start = 0
-
-    for i in range(n_batches):
-        # Distribute remainder across first batches
-        size = batch_size + (1 if i < remainder else 0)
-        if size > 0:
-            batches.append(data[start : start + size])
-            start += size
-
-    return batches
+    return [data[start:stop] for start, stop in _batch_bounds(len(data), n_batches)]
 
 
 def flatten_results(batch_results: list[list | None]) -> list:
@@ -79,11 +80,7 @@ def flatten_results(batch_results: list[list | None]) -> list:
     >>> flatten_results([])
     []
     """
-    flat = []
-    for batch in batch_results:
-        if batch is not None:
-            flat.extend(batch)
-    return flat
+    return list(chain.from_iterable(b for b in batch_results if b is not None))
 
 
 def create_batch_kwargs(
@@ -92,8 +89,9 @@ def create_batch_kwargs(
     """
     Split keyword arguments into batches for parallel processing.
 
-    Each kwarg value should be a list of the same length. This function
-    splits them into n_batches, preserving the correspondence between arguments.
+    Each kwarg value must be a list of the same length, otherwise a ValueError is
+    raised. This function splits them into n_batches, preserving the
+    correspondence between arguments.
 
     Parameters
     ----------
@@ -115,23 +113,17 @@ def create_batch_kwargs(
     if not kwargs:
         return []
 
-    # Get length from first value
-    first_key = next(iter(kwargs))
-    total_items = len(kwargs[first_key])
+    lengths = {len(values) for values in kwargs.values()}
+    if len(lengths) > 1:
+        raise ValueError(
+            f"All arguments must have the same length, got {sorted(lengths)}"
+        )
+    total_items = lengths.pop()
 
     if total_items == 0:
         return []
 
-    # Create index batches
-    indices = list(range(total_items))
-    index_batches = create_batches(indices, n_batches)
-
-    # Create kwarg batches using the index batches
-    batch_kwargs_list = []
-    for index_batch in index_batches:
-        batch_dict = {
-            key: [values[i] for i in index_batch] for key, values in kwargs.items()
-        }
-        batch_kwargs_list.append(batch_dict)
-
-    return batch_kwargs_list
+    return [
+        {key: values[start:stop] for key, values in kwargs.items()}
+        for start, stop in _batch_bounds(total_items, n_batches)
+    ]
@@ -0,0 +1,26 @@
+import multiprocessing as mp
+import os
+
+import pytest
+
+from py_parallelizer.executors.multiprocess import _init_worker
+
+
+def pytest_collection_modifyitems(config, items):
+    # Quick local runs can skip the process-based tests; CI always runs them
+    if os.environ.get("PY_PARALLELIZER_SKIP_MP") != "1":
+        return
+    skip = pytest.mark.skip(reason="PY_PARALLELIZER_SKIP_MP=1")
+    for item in items:
+        if item.get_closest_marker("multiprocess"):
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def process_pool():
+    """One worker pool shared by every test that asks for it."""
+    # Workers ignore SIGINT like the executors' own, so Ctrl+C reaches only pytest
+    pool = mp.Pool(processes=4, initializer=_init_worker)
+    yield pool
+    pool.terminate()
+    pool.join()
@@ -1,6 +1,9 @@
 """Integration tests for ParallelExecutor."""
 
-import time
+import multiprocessing as mp
+import threading
+
+import pytest
 
 from py_parallelizer import ParallelExecutor
 
@@ -9,45 +12,33 @@ def square(number: int) -> int:
     return number**2
 
 
-def square_with_sleep(number: int, sleep: float) -> int:
-    time.sleep(sleep)
+def square_at_barrier(number: int, barrier) -> int:
+    # Only returns once every task is running at the same time
+    barrier.wait(timeout=5)
     return number**2
 
 
 class TestParallelExecutorIntegration:
-    def test_threaded_is_faster_than_sequential(self):
+    def test_threaded_runs_tasks_concurrently(self):
         n_tasks = 5
-        sleep_time = 0.1
+        barrier = threading.Barrier(n_tasks)
 
-        start = time.time()
         results, _ = ParallelExecutor(
-            square_with_sleep, n_workers=n_tasks, verbose=False
-        ).run_threaded(
-            number=list(range(n_tasks)),
-            sleep=[sleep_time] * n_tasks,
-        )
-        elapsed = time.time() - start
-
-        sequential_time = n_tasks * sleep_time
-        assert elapsed < sequential_time * 0.6
-        assert len(results) == n_tasks
-
-    def test_multiprocess_is_faster_than_sequential(self):
-        n_tasks = 4
-        sleep_time = 0.5
+            square_at_barrier, n_workers=n_tasks, verbose=False
+        ).run_threaded(number=list(range(n_tasks)), barrier=[barrier] * n_tasks)
 
-        start = time.time()
-        results, _ = ParallelExecutor(
-            square_with_sleep, n_workers=n_tasks, verbose=False
-        ).run_multiprocess(
-            number=list(range(n_tasks)),
-            sleep=[sleep_time] * n_tasks,
-        )
-        elapsed = time.time() - start
+        assert results == [i**2 for i in range(n_tasks)]
+
+    @pytest.mark.multiprocess
+    def test_multiprocess_runs_tasks_concurrently(self):
+        n_tasks = 4
+        with mp.Manager() as manager:
+            barrier = manager.Barrier(n_tasks)
+            results, _ = ParallelExecutor(
+                square_at_barrier, n_workers=n_tasks, verbose=False
+            ).run_multiprocess(number=list(range(n_tasks)), barrier=[barrier] * n_tasks)
 
-        sequential_time = n_tasks * sleep_time
-        assert elapsed < sequential_time
-        assert len(results) == n_tasks
+        assert results == [i**2 for i in range(n_tasks)]
 
     def test_reuse_executor_instance(self):
         executor = ParallelExecutor(square, n_workers=2, verbose=False)
@@ -58,6 +49,7 @@ class TestParallelExecutorIntegration:
         assert results1 == [1, 4, 9]
         assert results2 == [16, 25, 36]
 
+    @pytest.mark.multiprocess
     def test_same_results_threaded_and_multiprocess(self):
         executor = ParallelExecutor(square, n_workers=2, verbose=False)
         numbers = [1, 2, 3, 4, 5]
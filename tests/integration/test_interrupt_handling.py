@@ -3,6 +3,8 @@
 import threading
 import time
 
+import pytest
+
 from py_parallelizer.executors.multiprocess import MultiprocessExecutor
 from py_parallelizer.executors.threader import ThreadedExecutor
 
@@ -97,6 +99,7 @@ class TestThreadedInterruptHandling:
         assert executor.results[3] is None
 
 
+@pytest.mark.multiprocess
 class TestMultiprocessInterruptHandling:
     def test_interrupt_flag_is_set(self):
         """Test that interrupt flag is properly set on cleanup."""
@@ -152,6 +155,7 @@ class TestParallelExecutorInterruptHandling:
         assert executor.results[2] is None
         assert executor.results[3] is None
 
+    @pytest.mark.multiprocess
     def test_multiprocess_partial_results_structure(self):
         """Test that multiprocess execution maintains result structure on interrupt."""
         executor = MultiprocessExecutor(
@@ -2,38 +2,52 @@
 
 import time
 
+import pytest
+
 from py_parallelizer.executors.multiprocess import MultiprocessExecutor
 
+pytestmark = pytest.mark.multiprocess
+
 
 def square(number: int) -> int:
     return number**2
 
 
-def square_with_sleep(number: int, sleep: float) -> int:
+def timed_sleep(sleep: float) -> tuple[float, float]:
+    start = time.perf_counter()
     time.sleep(sleep)
-    return number**2
+    return start, time.perf_counter()
 
 
 class TestMultiprocessExecutorIntegration:
-    def test_concurrent_execution_is_faster(self):
+    @pytest.mark.perf
+    def test_concurrent_execution_is_faster(self, process_pool):
         n_tasks = 4
-        sleep_time = 0.5
 
         executor = MultiprocessExecutor(
-            func=square_with_sleep, n_workers=n_tasks, verbose=False
+            func=timed_sleep, verbose=False, pool=process_pool
         )
+        spans, _ = executor.execute(sleep=[0.02] * n_tasks)
 
-        start = time.time()
-        results, _ = executor.execute(
-            number=list(range(n_tasks)), sleep=[sleep_time] * n_tasks
-        )
-        elapsed = time.time() - start
-
-        sequential_time = n_tasks * sleep_time
-        assert elapsed < sequential_time
-        assert results == [i**2 for i in range(n_tasks)]
+        # Compares the span of the tasks to their summed durations. Time before the
+        # first task starts does not count, but a worker picking up its task late
+        # does, so the workers come from the already running shared pool
+        starts, ends = zip(*spans, strict=True)
+        work = sum(end - start for start, end in spans)
+        assert max(ends) - min(starts) < work * 0.6
 
     def test_pool_cleanup_after_execution(self):
         executor = MultiprocessExecutor(func=square, n_workers=2, verbose=False)
         executor.execute(number=[1, 2, 3])
         assert executor.pool is None
+
+    def test_runs_on_shared_pool(self, process_pool):
+        for _ in range(2):
+            executor = MultiprocessExecutor(
+                func=square, verbose=False, pool=process_pool
+            )
+            results, _ = executor.execute(number=list(range(10)))
+            assert results == [i**2 for i in range(10)]
+            assert executor.pool is None
+        # Still usable, so the executors left it open
+        assert process_pool.apply(square, (3,)) == 9
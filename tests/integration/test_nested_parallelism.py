@@ -2,8 +2,12 @@
 
 import time
 
+import pytest
+
 from py_parallelizer import ParallelExecutor, create_batches, flatten_results
 
+pytestmark = pytest.mark.multiprocess
+
 
 def square(number: int) -> int:
     return number**2
@@ -32,14 +36,14 @@ def process_batch_simple(batch_numbers: list) -> list:
 
 
 class TestNestedParallelism:
-    def test_produces_correct_results(self):
+    def test_produces_correct_results(self, process_pool):
         all_numbers = list(range(12))
         n_processes = 3
 
         number_batches = create_batches(all_numbers, n_processes)
 
         batch_results, interrupted = ParallelExecutor(
-            process_batch_simple, n_workers=n_processes, verbose=False
+            process_batch_simple, verbose=False, pool=process_pool
         ).run_multiprocess(batch_numbers=number_batches)
 
         results = flatten_results(batch_results)
@@ -48,7 +52,8 @@ class TestNestedParallelism:
         assert sorted(results) == sorted(expected)
         assert interrupted is False
 
-    def test_with_sleep(self):
+    @pytest.mark.perf
+    def test_with_sleep(self, process_pool):
         all_numbers = list(range(12))
         all_sleep = [0.1] * len(all_numbers)
         n_processes = 4
@@ -58,7 +63,7 @@ class TestNestedParallelism:
 
         start = time.time()
         batch_results, interrupted = ParallelExecutor(
-            process_batch, n_workers=n_processes, verbose=False
+            process_batch, verbose=False, pool=process_pool
         ).run_multiprocess(batch_numbers=number_batches, batch_sleep=sleep_batches)
         elapsed = time.time() - start
 
@@ -71,7 +76,7 @@ class TestNestedParallelism:
         sequential_time = len(all_numbers) * 0.1
         assert elapsed < sequential_time
 
-    def test_varying_batch_sizes(self):
+    def test_varying_batch_sizes(self, process_pool):
         all_numbers = list(range(10))
         n_processes = 3
 
@@ -81,7 +86,7 @@ class TestNestedParallelism:
         assert sum(len(b) for b in number_batches) == 10
 
         batch_results, _ = ParallelExecutor(
-            process_batch_simple, n_workers=n_processes, verbose=False
+            process_batch_simple, verbose=False, pool=process_pool
         ).run_multiprocess(batch_numbers=number_batches)
 
         results = flatten_results(batch_results)
@@ -117,7 +122,8 @@ class TestNestedParallelism:
 
 
 class TestNestedParallelismPerformance:
-    def test_nested_faster_than_sequential(self):
+    @pytest.mark.perf
+    def test_nested_faster_than_sequential(self, process_pool):
         n_tasks = 12
         sleep_time = 0.1
         all_numbers = list(range(n_tasks))
@@ -129,7 +135,7 @@ class TestNestedParallelismPerformance:
 
         start = time.time()
         batch_results, _ = ParallelExecutor(
-            process_batch, n_workers=n_processes, verbose=False
+            process_batch, verbose=False, pool=process_pool
         ).run_multiprocess(batch_numbers=number_batches, batch_sleep=sleep_batches)
         nested_elapsed = time.time() - start
 
@@ -2,7 +2,7 @@
 
 import pytest
 
-from py_parallelizer.executors.base import BaseParallelExecutor
+from py_parallelizer.executors.base import BaseParallelExecutor, _call, _cpu_count
 
 
 class TestBaseParallelExecutor:
@@ -16,72 +16,117 @@ class TestBaseParallelExecutor:
             )
 
 
-class TestFormatArgs:
-    def test_empty_kwargs(self):
-        result = BaseParallelExecutor._format_args()
-        assert result == []
+def subtract(a: int, b: int) -> int:
+    return a - b
+
+
+class TestIterValues:
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            ({}, []),
+            ({"x": [1, 2, 3]}, [(1,), (2,), (3,)]),
+            (
+                {"x": [1, 2, 3], "y": ["a", "b", "c"]},
+                [(1, "a"), (2, "b"), (3, "c")],
+            ),
+            ({"x": range(3), "y": [10, 20, 30]}, [(0, 10), (1, 20), (2, 30)]),
+            (
+                {"number": [1, 2], "data": [{"key": "value"}, [1, 2, 3]]},
+                [(1, {"key": "value"}), (2, [1, 2, 3])],
+            ),
+        ],
+        ids=["empty", "single", "multiple", "range", "preserves_types"],
+    )
+    def test_iter_values(self, kwargs, expected):
+        assert list(BaseParallelExecutor._iter_values(**kwargs)) == expected
+
+    def test_mismatched_lengths_raises_error(self):
+        with pytest.raises(ValueError):
+            list(BaseParallelExecutor._iter_values(x=[1, 2, 3], y=[1, 2]))
+
 
-    def test_single_argument(self):
-        result = BaseParallelExecutor._format_args(x=[1, 2, 3])
-        assert result == [{"x": 1}, {"x": 2}, {"x": 3}]
+class TestCall:
+    def test_keyword_call(self):
+        assert _call(subtract, ("b", "a"), (1, 10)) == 9
 
-    def test_multiple_arguments(self):
-        result = BaseParallelExecutor._format_args(x=[1, 2, 3], y=["a", "b", "c"])
-        expected = [{"x": 1, "y": "a"}, {"x": 2, "y": "b"}, {"x": 3, "y": "c"}]
-        assert result == expected
+    def test_positional_call(self):
+        assert _call(subtract, None, (1, 10)) == -9
 
-    def test_with_range(self):
-        result = BaseParallelExecutor._format_args(x=range(3), y=[10, 20, 30])
-        expected = [{"x": 0, "y": 10}, {"x": 1, "y": 20}, {"x": 2, "y": 30}]
-        assert result == expected
+
+class TestCountJobs:
+    def test_empty_kwargs(self):
+        assert BaseParallelExecutor._count_jobs() == 0
+
+    def test_counts_tasks(self):
+        assert BaseParallelExecutor._count_jobs(x=[1, 2, 3], y=range(3)) == 3
 
     def test_mismatched_lengths_raises_error(self):
-        with pytest.raises(ValueError):
-            BaseParallelExecutor._format_args(x=[1, 2, 3], y=[1, 2])
+        with pytest.raises(ValueError, match="same length"):
+            BaseParallelExecutor._count_jobs(x=[1, 2, 3], y=[1, 2])
+
+    def test_generators_are_materialized(self):
+        kwargs = BaseParallelExecutor._as_columns(x=(i for i in range(3)))
+        assert BaseParallelExecutor._count_jobs(**kwargs) == 3
+        assert list(BaseParallelExecutor._iter_values(**kwargs)) == [(0,), (1,), (2,)]
+
 
-    def test_preserves_types(self):
-        result = BaseParallelExecutor._format_args(
-            number=[1, 2],
-            name=["alice", "bob"],
-            data=[{"key": "value"}, [1, 2, 3]],
-        )
-        assert result[0]["data"] == {"key": "value"}
-        assert result[1]["data"] == [1, 2, 3]
+@pytest.fixture(scope="module")
+def concrete_executor_class():
+    class ConcreteExecutor(BaseParallelExecutor):
+        def execute(self, **kwargs) -> tuple[list, bool]:
+            return [], False
+
+        def _cleanup_on_interrupt(self) -> None:
+            pass
+
+        def _cleanup_on_done(self) -> None:
+            pass
+
+    return ConcreteExecutor
+
+
+@pytest.fixture(scope="module")
+def make_executor(concrete_executor_class):
+    """Build a quiet executor, overriding only what a test cares about."""
+
+    def make(**overrides):
+        options = {
+            "func": lambda x: x,
+            "n_workers": 2,
+            "pbar_color": "blue",
+            "verbose": False,
+        }
+        return concrete_executor_class(**{**options, **overrides})
+
+    return make
 
 
 class TestConcreteExecutor:
-    @pytest.fixture
-    def concrete_executor_class(self):
-        class ConcreteExecutor(BaseParallelExecutor):
-            def execute(self, **kwargs) -> tuple[list, bool]:
-                return [], False
-
-            def _cleanup_on_interrupt(self) -> None:
-                pass
-
-            def _cleanup_on_done(self) -> None:
-                pass
-
-        return ConcreteExecutor
-
-    def test_initialization(self, concrete_executor_class):
-        executor = concrete_executor_class(
-            func=lambda x: x * 2,
-            n_workers=4,
-            pbar_color="green",
-            verbose=False,
-        )
+    def test_initialization(self, make_executor):
+        executor = make_executor(n_workers=4)
         assert executor.n_workers == 4
         assert executor.interrupt is False
         assert executor.pbar is None
 
-    def test_verbose_creates_pbar(self, concrete_executor_class):
-        executor = concrete_executor_class(
-            func=lambda x: x,
-            n_workers=2,
-            pbar_color="blue",
-            verbose=True,
-        )
+    def test_rejects_non_positive_chunksize(self, make_executor):
+        with pytest.raises(ValueError, match="chunksize must be positive"):
+            make_executor(chunksize=0)
+
+    def test_default_workers_uses_cpu_count(self, make_executor):
+        executor = make_executor(n_workers=None)
+        assert executor.n_workers == _cpu_count() >= 1
+
+    def test_verbose_creates_pbar(self, make_executor):
+        executor = make_executor(verbose=True)
         executor.init_pbar(total=5)
         assert executor.pbar is not None
         executor.pbar.close()
+
+    def test_pbar_update_counts_every_task(self, make_executor):
+        executor = make_executor(verbose=True)
+        executor.init_pbar(total=50)
+        for _ in range(50):
+            executor.pbar_update()
+        executor.pbar_close()
+        assert executor.pbar.n == 50
@@ -20,6 +20,12 @@ def add(a: int, b: int) -> int:
     return a + b
 
 
+def fail_on_three(number: int) -> int:
+    if number == 3:
+        raise ValueError("three is not allowed")
+    return number
+
+
 class TestParallelExecutorInit:
     def test_init_with_func_only(self):
         executor = ParallelExecutor(square)
@@ -55,33 +61,25 @@ class TestRunThreaded:
         ).run_threaded(number=[1, 2, 3])
         assert results == [1, 4, 9]
 
-    def test_maintains_order(self):
-        results, interrupted = ParallelExecutor(
-            square_with_sleep, n_workers=5, verbose=False
-        ).run_threaded(
-            number=[5, 4, 3, 2, 1],
-            sleep=[0.05, 0.04, 0.03, 0.02, 0.01],
-        )
-        assert results == [25, 16, 9, 4, 1]
-
     def test_empty_input(self):
         results, interrupted = ParallelExecutor(square, verbose=False).run_threaded()
         assert results == []
         assert interrupted is False
 
 
+@pytest.mark.multiprocess
 class TestRunMultiprocess:
-    def test_basic_execution(self):
-        results, interrupted = ParallelExecutor(square, verbose=False).run_multiprocess(
-            number=[1, 2, 3, 4, 5]
-        )
+    def test_basic_execution(self, process_pool):
+        results, interrupted = ParallelExecutor(
+            square, verbose=False, pool=process_pool
+        ).run_multiprocess(number=[1, 2, 3, 4, 5])
         assert results == [1, 4, 9, 16, 25]
         assert interrupted is False
 
-    def test_with_multiple_args(self):
-        results, interrupted = ParallelExecutor(add, verbose=False).run_multiprocess(
-            a=[1, 2, 3], b=[10, 20, 30]
-        )
+    def test_with_multiple_args(self, process_pool):
+        results, interrupted = ParallelExecutor(
+            add, verbose=False, pool=process_pool
+        ).run_multiprocess(a=[1, 2, 3], b=[10, 20, 30])
         assert results == [11, 22, 33]
         assert interrupted is False
 
@@ -91,15 +89,6 @@ class TestRunMultiprocess:
         ).run_multiprocess(number=[1, 2, 3])
         assert results == [1, 4, 9]
 
-    def test_maintains_order(self):
-        results, interrupted = ParallelExecutor(
-            square_with_sleep, n_workers=4, verbose=False
-        ).run_multiprocess(
-            number=[4, 3, 2, 1],
-            sleep=[0.1, 0.08, 0.06, 0.04],
-        )
-        assert results == [16, 9, 4, 1]
-
     def test_empty_input(self):
         results, interrupted = ParallelExecutor(
             square, verbose=False
@@ -108,12 +97,46 @@ class TestRunMultiprocess:
         assert interrupted is False
 
 
+class TestResultOrder:
+    @pytest.mark.parametrize(
+        "runner",
+        ["threaded", pytest.param("multiprocess", marks=pytest.mark.multiprocess)],
+    )
+    def test_maintains_order(self, runner):
+        # Earlier tasks sleep longer, so they finish last
+        executor = ParallelExecutor(square_with_sleep, n_workers=5, verbose=False)
+        results, _ = getattr(executor, f"run_{runner}")(
+            number=[5, 4, 3, 2, 1],
+            sleep=[0.005, 0.004, 0.003, 0.002, 0.001],
+        )
+        assert results == [25, 16, 9, 4, 1]
+
+
+class TestErrors:
+    @pytest.mark.parametrize(
+        "runner",
+        ["threaded", pytest.param("multiprocess", marks=pytest.mark.multiprocess)],
+    )
+    def test_errors_of_last_run_are_kept(self, runner):
+        executor = ParallelExecutor(
+            fail_on_three, n_workers=2, verbose=False, fail_fast=False
+        )
+        results, _ = getattr(executor, f"run_{runner}")(number=list(range(5)))
+        assert results == [0, 1, 2, None, 4]
+        assert list(executor.errors) == [3]
+        assert isinstance(executor.errors[3], ValueError)
+
+        getattr(executor, f"run_{runner}")(number=[1, 2])
+        assert executor.errors == {}
+
+
 class TestArgumentValidation:
     def test_invalid_kwarg_raises_typeerror_threaded(self):
         """Test that invalid kwargs raise TypeError."""
         with pytest.raises(TypeError, match="unexpected keyword argument"):
             ParallelExecutor(square, verbose=False).run_threaded(invalid_arg=[1, 2, 3])
 
+    @pytest.mark.multiprocess
     def test_invalid_kwarg_raises_typeerror_multiprocess(self):
         """Test that invalid kwargs raise TypeError."""
         with pytest.raises(TypeError, match="unexpected keyword argument"):
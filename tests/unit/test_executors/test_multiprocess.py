@@ -1,8 +1,19 @@
 """Tests for multiprocess executor."""
 
+import multiprocessing as mp
+import os
+import threading
 import time
 
-from py_parallelizer.executors.multiprocess import MultiprocessExecutor
+import pytest
+
+from py_parallelizer.executors.multiprocess import (
+    MultiprocessExecutor,
+    _create_pool,
+    _init_worker,
+)
+
+pytestmark = pytest.mark.multiprocess
 
 
 def square(number: int) -> int:
@@ -18,6 +29,59 @@ def add(a: int, b: int) -> int:
     return a + b
 
 
+def subtract(a: int, b: int) -> int:
+    return a - b
+
+
+def fail_on_three(number: int) -> int:
+    if number == 3:
+        raise ValueError("three is not allowed")
+    return number
+
+
+def fail_after(sleep: float) -> None:
+    time.sleep(sleep)
+    raise ValueError("failed after sleeping")
+
+
+def reject_nine(result: int, process_index: int) -> int:
+    if result == 9:
+        raise ValueError("nine is not allowed")
+    return result
+
+
+def n_allowed_cpus(number: int) -> int:
+    return len(os.sched_getaffinity(0))
+
+
+def worker_pid(number: int) -> int:
+    return os.getpid()
+
+
+def pinned_cpus(number: int) -> tuple[int, tuple[int, ...]]:
+    time.sleep(0.05)
+    return os.getpid(), tuple(sorted(os.sched_getaffinity(0)))
+
+
+_worker_state = {}
+
+
+def remember(label: str) -> None:
+    _worker_state["label"] = label
+
+
+def read_label(number: int) -> str | None:
+    return _worker_state.get("label")
+
+
+def fail_init(label: str) -> None:
+    raise RuntimeError(f"cannot initialize {label}")
+
+
+def exit_init(label: str) -> None:
+    raise SystemExit(f"cannot initialize {label}")
+
+
 class TestMultiprocessExecutor:
     def test_returns_correct_results(self):
         executor = MultiprocessExecutor(func=square, n_workers=2, verbose=False)
@@ -31,6 +95,13 @@ class TestMultiprocessExecutor:
         assert results == [11, 22, 33]
         assert interrupted is False
 
+    def test_positional_uses_keyword_order(self):
+        executor = MultiprocessExecutor(
+            func=subtract, n_workers=2, verbose=False, positional=True
+        )
+        results, _ = executor.execute(first=[10, 20], second=[1, 2])
+        assert results == [9, 18]
+
     def test_maintains_order(self):
         executor = MultiprocessExecutor(
             func=square_with_sleep, n_workers=4, verbose=False
@@ -52,11 +123,267 @@ class TestMultiprocessExecutor:
         assert results == []
         assert interrupted is False
 
+    def test_empty_tasks_with_worker_init_starts_no_pool(self):
+        executor = MultiprocessExecutor(
+            func=read_label,
+            n_workers=2,
+            verbose=False,
+            worker_init=remember,
+            worker_init_args=("ready",),
+        )
+        results, interrupted = executor.execute(number=[])
+        assert results == []
+        assert interrupted is False
+        assert executor.pool is None
+
     def test_more_workers_than_tasks(self):
         executor = MultiprocessExecutor(func=square, n_workers=10, verbose=False)
         results, interrupted = executor.execute(number=[1, 2])
         assert results == [1, 4]
 
+    def test_explicit_chunksize(self):
+        executor = MultiprocessExecutor(
+            func=square, n_workers=2, verbose=False, chunksize=7
+        )
+        results, _ = executor.execute(number=list(range(30)))
+        assert results == [i**2 for i in range(30)]
+
+    def test_single_task_runs_in_a_worker(self):
+        executor = MultiprocessExecutor(func=worker_pid, n_workers=2, verbose=False)
+        results, _ = executor.execute(number=[1])
+        assert results != [os.getpid()]
+
+    def test_single_task_with_worker_init_uses_a_worker(self):
+        executor = MultiprocessExecutor(
+            func=read_label,
+            n_workers=2,
+            verbose=False,
+            worker_init=remember,
+            worker_init_args=("ready",),
+        )
+        results, _ = executor.execute(number=[1])
+        assert results == ["ready"]
+
+    def test_executor_can_run_twice(self):
+        executor = MultiprocessExecutor(func=square, n_workers=2, verbose=False)
+        executor.execute(number=[1, 2, 3])
+        results, _ = executor.execute(number=[4, 5, 6])
+        assert results == [16, 25, 36]
+
+    def test_many_tasks_are_chunked_and_ordered(self):
+        executor = MultiprocessExecutor(func=square, n_workers=2, verbose=False)
+        results, interrupted = executor.execute(number=list(range(100)))
+        assert results == [i**2 for i in range(100)]
+        assert interrupted is False
+
+    def test_reraises_worker_error(self):
+        executor = MultiprocessExecutor(func=fail_on_three, n_workers=2, verbose=False)
+        with pytest.raises(ValueError, match="three is not allowed"):
+            executor.execute(number=list(range(10)))
+
+    def test_pool_size_is_capped_at_task_count(self, monkeypatch):
+        pool_sizes = []
+
+        def create_pool(n_workers, *args):
+            pool_sizes.append(n_workers)
+            return _create_pool(n_workers, *args)
+
+        monkeypatch.setattr(
+            "py_parallelizer.executors.multiprocess._create_pool", create_pool
+        )
+        executor = MultiprocessExecutor(func=square, n_workers=8, verbose=False)
+        results, _ = executor.execute(number=[1, 2])
+        assert results == [1, 4]
+        assert pool_sizes == [2]
+
+    def test_results_func_error_stops_pool(self):
+        executor = MultiprocessExecutor(
+            func=square, n_workers=2, verbose=True, results_func=reject_nine
+        )
+        with pytest.raises(ValueError, match="nine is not allowed"):
+            executor.execute(number=list(range(10)))
+        assert executor.pool is None
+        assert executor.pbar.disable
+
+    def test_fail_fast_terminates_pool(self):
+        executor = MultiprocessExecutor(func=fail_on_three, n_workers=2, verbose=False)
+        with pytest.raises(ValueError):
+            executor.execute(number=list(range(10)))
+        assert executor.pool is None
+        assert list(executor.errors) == [3]
+
+    def test_fail_fast_leaves_external_pool_open(self, process_pool):
+        executor = MultiprocessExecutor(
+            func=fail_on_three, verbose=False, pool=process_pool
+        )
+        with pytest.raises(ValueError):
+            executor.execute(number=list(range(10)))
+        assert executor.pool is None
+        assert process_pool.apply(fail_on_three, (4,)) == 4
+
+    @pytest.mark.parametrize(
+        "option",
+        [
+            {"n_workers": 2},
+            {"persistent_pool": True},
+            {"max_tasks_per_child": 1},
+            {"cpu_affinity": True},
+            {"worker_init": remember, "worker_init_args": ("ready",)},
+            {"start_method": "spawn"},
+        ],
+    )
+    def test_external_pool_rejects_pool_options(self, process_pool, option):
+        with pytest.raises(ValueError, match="pool cannot be combined with"):
+            MultiprocessExecutor(
+                func=square, verbose=False, pool=process_pool, **option
+            )
+
+    def test_collects_errors_without_fail_fast(self):
+        executor = MultiprocessExecutor(
+            func=fail_on_three, n_workers=2, verbose=False, fail_fast=False
+        )
+        results, _ = executor.execute(number=list(range(6)))
+        assert results == [0, 1, 2, None, 4, 5]
+        assert isinstance(executor.errors[3], ValueError)
+
+    def test_persistent_pool_is_reused(self):
+        first = MultiprocessExecutor(
+            func=square, n_workers=2, verbose=False, persistent_pool=True
+        )
+        first.execute(number=[1, 2, 3])
+        second = MultiprocessExecutor(
+            func=add, n_workers=2, verbose=False, persistent_pool=True
+        )
+        results, _ = second.execute(a=[1, 2], b=[3, 4])
+        assert second.pool is first.pool
+        assert results == [4, 6]
+
+    def test_persistent_pool_is_evicted_on_interrupt(self):
+        executor = MultiprocessExecutor(
+            func=square, n_workers=3, verbose=False, persistent_pool=True
+        )
+        executor.execute(number=[1, 2, 3])
+        shared_pool = executor.pool
+        executor._cleanup_on_interrupt()
+        replacement = MultiprocessExecutor(
+            func=square, n_workers=3, verbose=False, persistent_pool=True
+        )
+        replacement.execute(number=[1, 2, 3])
+        assert replacement.pool is not shared_pool
+
+    def test_fail_fast_error_leaves_shared_pool_running(self):
+        failing = MultiprocessExecutor(
+            func=fail_after, n_workers=2, verbose=False, persistent_pool=True
+        )
+        other = MultiprocessExecutor(
+            func=square_with_sleep, n_workers=2, verbose=False, persistent_pool=True
+        )
+        outcome = {}
+
+        def run_other():
+            # Queues its tasks on the shared pool while the failing run is going
+            time.sleep(0.1)
+            outcome["results"], _ = other.execute(number=[1, 2, 3], sleep=[0.01] * 3)
+
+        runner = threading.Thread(target=run_other, daemon=True)
+        runner.start()
+        with pytest.raises(ValueError):
+            failing.execute(sleep=[0.3, 0.3])
+        runner.join(timeout=10)
+        assert not runner.is_alive()
+        assert outcome["results"] == [1, 4, 9]
+
+    def test_max_tasks_per_child_replaces_workers(self):
+        executor = MultiprocessExecutor(
+            func=worker_pid, n_workers=2, verbose=False, max_tasks_per_child=1
+        )
+        results, _ = executor.execute(number=list(range(16)))
+        assert len(set(results)) > 2
+
+    @pytest.mark.parametrize("start_method", ["spawn", "forkserver"])
+    def test_start_method(self, start_method):
+        executor = MultiprocessExecutor(
+            func=square, n_workers=2, verbose=False, start_method=start_method
+        )
+        results, _ = executor.execute(number=[1, 2, 3])
+        assert results == [1, 4, 9]
+
+    def test_worker_init_runs_in_each_worker(self):
+        executor = MultiprocessExecutor(
+            func=read_label,
+            n_workers=2,
+            verbose=False,
+            worker_init=remember,
+            worker_init_args=("ready",),
+        )
+        results, _ = executor.execute(number=list(range(8)))
+        assert results == ["ready"] * 8
+
+    @pytest.mark.parametrize("fail_fast", [True, False])
+    def test_failing_worker_init_raises(self, fail_fast):
+        executor = MultiprocessExecutor(
+            func=read_label,
+            n_workers=2,
+            verbose=False,
+            worker_init=fail_init,
+            worker_init_args=("worker",),
+            fail_fast=fail_fast,
+        )
+        with pytest.raises(RuntimeError, match="cannot initialize worker"):
+            executor.execute(number=list(range(8)))
+
+    @pytest.mark.skipif(
+        not hasattr(os, "sched_setaffinity"), reason="CPU affinity is Linux only"
+    )
+    def test_worker_init_exiting_raises(self):
+        executor = MultiprocessExecutor(
+            func=read_label,
+            n_workers=2,
+            verbose=False,
+            worker_init=exit_init,
+            worker_init_args=("worker",),
+        )
+        with pytest.raises(SystemExit, match="cannot initialize worker"):
+            executor.execute(number=list(range(8)))
+
+    def test_cpu_affinity_pins_each_worker(self):
+        executor = MultiprocessExecutor(
+            func=n_allowed_cpus, n_workers=2, verbose=False, cpu_affinity=True
+        )
+        results, _ = executor.execute(number=[1, 2, 3, 4])
+        assert results == [1, 1, 1, 1]
+
+    @pytest.mark.skipif(
+        not hasattr(os, "sched_setaffinity") or len(os.sched_getaffinity(0)) < 2,
+        reason="needs CPU affinity and at least two CPUs",
+    )
+    def test_cpu_affinity_pins_workers_to_different_cpus(self):
+        executor = MultiprocessExecutor(
+            func=pinned_cpus,
+            n_workers=2,
+            verbose=False,
+            cpu_affinity=True,
+            chunksize=1,
+        )
+        results, _ = executor.execute(number=list(range(8)))
+        cpus_per_worker = dict(results)
+        assert len(set(cpus_per_worker.values())) == len(cpus_per_worker)
+
+    @pytest.mark.skipif(
+        not hasattr(os, "sched_setaffinity"), reason="CPU affinity is Linux only"
+    )
+    def test_cpu_affinity_uses_the_worker_index_in_its_own_pool(self, monkeypatch):
+        # A worker of a pool started inside another worker has identity (parent, own)
+        pinned = []
+        monkeypatch.setattr(os, "sched_getaffinity", lambda pid: {0, 1, 2, 3})
+        monkeypatch.setattr(
+            os, "sched_setaffinity", lambda pid, cpus: pinned.append(cpus)
+        )
+        monkeypatch.setattr(mp.current_process(), "_identity", (1, 3))
+        monkeypatch.setattr("signal.signal", lambda *args: None)
+        _init_worker(cpu_affinity=True)
+        assert pinned == [{2}]
+
     def test_no_progress_bar_when_not_verbose(self):
         executor = MultiprocessExecutor(func=square, n_workers=2, verbose=False)
         assert executor.pbar is None
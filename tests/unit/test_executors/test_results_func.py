@@ -1,7 +1,10 @@
 """Tests for results_func functionality in executors."""
 
+import os
 import threading
 
+import pytest
+
 from py_parallelizer import ParallelExecutor
 from py_parallelizer.executors.multiprocess import MultiprocessExecutor
 from py_parallelizer.executors.threader import ThreadedExecutor
@@ -20,6 +23,10 @@ def transform_result(result, process_index):
     return result + process_index
 
 
+def tag_with_pid(result, process_index):
+    return result, os.getpid()
+
+
 def transform_result_with_kwargs(result, **kwargs):
     """Results function using kwargs to accept process_index."""
     return result + kwargs.get("process_index", 0)
@@ -110,6 +117,7 @@ class TestThreadedExecutorResultsFunc:
         assert interrupted is False
 
 
+@pytest.mark.multiprocess
 class TestMultiprocessExecutorResultsFunc:
     def test_results_func_is_called(self):
         """Test that results_func is called for each result."""
@@ -153,6 +161,20 @@ class TestMultiprocessExecutorResultsFunc:
 
         assert results == [1, 5, 11]
 
+    def test_results_func_in_worker(self):
+        """Test that results_func can run inside the worker processes."""
+        executor = MultiprocessExecutor(
+            func=square,
+            n_workers=2,
+            verbose=False,
+            results_func=tag_with_pid,
+            results_func_in_worker=True,
+        )
+        results, _ = executor.execute(number=[1, 2, 3])
+
+        assert [value for value, _ in results] == [1, 4, 9]
+        assert all(pid != os.getpid() for _, pid in results)
+
     def test_no_results_func(self):
         """Test normal operation without results_func."""
         executor = MultiprocessExecutor(func=square, n_workers=2, verbose=False)
@@ -172,6 +194,7 @@ class TestParallelExecutorResultsFunc:
 
         assert results == [1, 5, 11]
 
+    @pytest.mark.multiprocess
     def test_results_func_with_run_multiprocess(self):
         """Test that results_func works with run_multiprocess."""
         executor = ParallelExecutor(
@@ -197,6 +220,7 @@ class TestParallelExecutorResultsFunc:
         )
         assert results == [1, 4, 9]
 
+    @pytest.mark.multiprocess
     def test_no_results_func_multiprocess(self):
         """Test normal multiprocess operation without results_func."""
         results, _ = ParallelExecutor(square, verbose=False).run_multiprocess(
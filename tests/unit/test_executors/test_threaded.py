@@ -1,6 +1,8 @@
 """Tests for threaded executor."""
 
-import time
+import threading
+
+import pytest
 
 from py_parallelizer.executors.threader import ThreadedExecutor
 
@@ -9,8 +11,11 @@ def square(number: int) -> int:
     return number**2
 
 
-def square_with_sleep(number: int, sleep: float) -> int:
-    time.sleep(sleep)
+def square_in_turn(
+    number: int, turn: threading.Event, next_turn: threading.Event
+) -> int:
+    turn.wait(timeout=5)
+    next_turn.set()
     return number**2
 
 
@@ -18,6 +23,51 @@ def add(a: int, b: int) -> int:
     return a + b
 
 
+def subtract(a: int, b: int) -> int:
+    return a - b
+
+
+def fail_on_three(number: int) -> int:
+    if number == 3:
+        raise ValueError("three is not allowed")
+    return number
+
+
+class Abort(BaseException):
+    pass
+
+
+def abort_on_three(number: int) -> int:
+    if number == 3:
+        raise Abort()
+    return number
+
+
+def reject_nine(result: int, process_index: int) -> int:
+    if result == 9:
+        raise ValueError("nine is not allowed")
+    return result
+
+
+def thread_ident(number: int) -> int:
+    return threading.get_ident()
+
+
+_thread_state = threading.local()
+
+
+def remember(label: str) -> None:
+    _thread_state.label = label
+
+
+def read_label(number: int) -> str | None:
+    return getattr(_thread_state, "label", None)
+
+
+def fail_init(label: str) -> None:
+    raise RuntimeError(f"cannot initialize {label}")
+
+
 class TestThreadedExecutor:
     def test_returns_correct_results(self):
         executor = ThreadedExecutor(func=square, n_workers=2, verbose=False)
@@ -31,11 +81,20 @@ class TestThreadedExecutor:
         assert results == [11, 22, 33]
         assert interrupted is False
 
+    def test_positional_uses_keyword_order(self):
+        executor = ThreadedExecutor(
+            func=subtract, n_workers=2, verbose=False, positional=True
+        )
+        results, _ = executor.execute(first=[10, 20], second=[1, 2])
+        assert results == [9, 18]
+
     def test_maintains_order(self):
-        executor = ThreadedExecutor(func=square_with_sleep, n_workers=5, verbose=False)
+        # Each task waits for the one after it, so they finish in reverse order
+        turns = [threading.Event() for _ in range(6)]
+        turns[-1].set()
+        executor = ThreadedExecutor(func=square_in_turn, n_workers=5, verbose=False)
         results, interrupted = executor.execute(
-            number=[1, 2, 3, 4, 5],
-            sleep=[0.05, 0.04, 0.03, 0.02, 0.01],
+            number=[1, 2, 3, 4, 5], turn=turns[1:], next_turn=turns[:-1]
         )
         assert results == [1, 4, 9, 16, 25]
 
@@ -50,11 +109,127 @@ class TestThreadedExecutor:
         assert results == []
         assert interrupted is False
 
+    def test_empty_tasks_with_worker_init_starts_no_pool(self):
+        executor = ThreadedExecutor(
+            func=read_label,
+            n_workers=2,
+            verbose=False,
+            worker_init=remember,
+            worker_init_args=("ready",),
+        )
+        results, interrupted = executor.execute(number=[])
+        assert results == []
+        assert interrupted is False
+        assert executor.pool is None
+
     def test_more_workers_than_tasks(self):
         executor = ThreadedExecutor(func=square, n_workers=10, verbose=False)
         results, interrupted = executor.execute(number=[1, 2])
         assert results == [1, 4]
 
+    def test_explicit_chunksize(self):
+        executor = ThreadedExecutor(
+            func=square, n_workers=2, verbose=False, chunksize=7
+        )
+        results, _ = executor.execute(number=list(range(30)))
+        assert results == [i**2 for i in range(30)]
+
+    def test_single_task_runs_inline(self):
+        executor = ThreadedExecutor(func=thread_ident, n_workers=2, verbose=False)
+        results, _ = executor.execute(number=[1])
+        assert results == [threading.get_ident()]
+
+    def test_single_worker_runs_inline(self):
+        executor = ThreadedExecutor(func=thread_ident, n_workers=1, verbose=False)
+        results, _ = executor.execute(number=[1, 2, 3])
+        assert results == [threading.get_ident()] * 3
+        assert executor.pool is None
+
+    def test_single_worker_stops_at_first_error(self):
+        executor = ThreadedExecutor(func=fail_on_three, n_workers=1, verbose=False)
+        with pytest.raises(ValueError):
+            executor.execute(number=list(range(10)))
+        assert executor.results[:3] == [0, 1, 2]
+        assert executor.n_collected == 3
+
+    def test_many_tasks_are_chunked_and_ordered(self):
+        executor = ThreadedExecutor(func=square, n_workers=3, verbose=False)
+        results, interrupted = executor.execute(number=list(range(100)))
+        assert results == [i**2 for i in range(100)]
+        assert interrupted is False
+        assert executor.pool is None
+
+    def test_reraises_worker_error(self):
+        executor = ThreadedExecutor(func=fail_on_three, n_workers=2, verbose=False)
+        with pytest.raises(ValueError, match="three is not allowed"):
+            executor.execute(number=list(range(10)))
+        assert list(executor.errors) == [3]
+
+    def test_reusable_after_fail_fast(self):
+        executor = ThreadedExecutor(func=fail_on_three, n_workers=4, verbose=False)
+        with pytest.raises(ValueError):
+            executor.execute(number=list(range(40)))
+        results, _ = executor.execute(number=[4, 5, 6])
+        assert results == [4, 5, 6]
+        assert executor.results_queue.empty()
+
+    def test_collects_errors_without_fail_fast(self):
+        executor = ThreadedExecutor(
+            func=fail_on_three, n_workers=2, verbose=False, fail_fast=False
+        )
+        results, _ = executor.execute(number=list(range(6)))
+        assert results == [0, 1, 2, None, 4, 5]
+        assert isinstance(executor.errors[3], ValueError)
+
+    def test_results_func_error_stops_the_run(self):
+        executor = ThreadedExecutor(
+            func=square, n_workers=2, verbose=True, results_func=reject_nine
+        )
+        with pytest.raises(ValueError, match="nine is not allowed"):
+            executor.execute(number=list(range(40)))
+        assert executor.pool is None
+        assert executor.pbar.disable
+        # Nothing of the failed run is left for the next one
+        executor.results_func = None
+        results, _ = executor.execute(number=[1, 2])
+        assert results == [1, 4]
+
+    def test_worker_init_runs_in_each_thread(self):
+        executor = ThreadedExecutor(
+            func=read_label,
+            n_workers=3,
+            verbose=False,
+            worker_init=remember,
+            worker_init_args=("ready",),
+        )
+        results, _ = executor.execute(number=list(range(12)))
+        assert results == ["ready"] * 12
+
+    @pytest.mark.parametrize("fail_fast", [True, False])
+    def test_base_exception_in_task_stops_the_run(self, fail_fast):
+        executor = ThreadedExecutor(
+            func=abort_on_three,
+            n_workers=2,
+            verbose=False,
+            fail_fast=fail_fast,
+            chunksize=2,
+        )
+        with pytest.raises(Abort):
+            executor.execute(number=list(range(8)))
+
+    @pytest.mark.parametrize("fail_fast", [True, False])
+    def test_failing_worker_init_raises(self, fail_fast):
+        executor = ThreadedExecutor(
+            func=read_label,
+            n_workers=3,
+            verbose=False,
+            worker_init=fail_init,
+            worker_init_args=("worker",),
+            fail_fast=fail_fast,
+        )
+        with pytest.raises(RuntimeError, match="cannot initialize worker"):
+            executor.execute(number=list(range(8)))
+
     def test_creates_progress_bar_when_verbose(self):
         executor = ThreadedExecutor(func=square, n_workers=2, verbose=True)
         executor.execute(number=[1, 2, 3])
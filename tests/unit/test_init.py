@@ -0,0 +1,29 @@
+"""Tests for the package namespace."""
+
+import subprocess
+import sys
+
+import pytest
+
+import py_parallelizer
+
+
+class TestLazyImports:
+    def test_import_does_not_load_executors(self):
+        code = (
+            "import sys, py_parallelizer; "
+            "print('tqdm' in sys.modules, 'multiprocessing.pool' in sys.modules)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert output.split() == ["False", "False"]
+
+    @pytest.mark.parametrize("name", py_parallelizer.__all__)
+    def test_public_names_resolve(self, name):
+        assert getattr(py_parallelizer, name).__name__ == name
+        assert name in dir(py_parallelizer)
+
+    def test_unknown_name_raises(self):
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            py_parallelizer.missing  # noqa: B018
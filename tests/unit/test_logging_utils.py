@@ -1,5 +1,6 @@
 """Tests for logging utilities."""
 
+import io
 import logging
 
 import pytest
@@ -7,6 +8,24 @@ import pytest
 from py_parallelizer.utils.logging import TqdmLoggingHandler, setup_logger
 
 
+@pytest.fixture(scope="module")
+def info_record():
+    return logging.LogRecord(
+        name="test",
+        level=logging.INFO,
+        pathname="",
+        lineno=0,
+        msg="Test message",
+        args=(),
+        exc_info=None,
+    )
+
+
+@pytest.fixture(scope="module")
+def handler():
+    return TqdmLoggingHandler()
+
+
 class TestTqdmLoggingHandler:
     def test_default_level(self):
         handler = TqdmLoggingHandler()
@@ -16,86 +35,52 @@ class TestTqdmLoggingHandler:
         handler = TqdmLoggingHandler(level=logging.DEBUG)
         assert handler.level == logging.DEBUG
 
-    def test_emit_writes_message(self, capsys):
-        handler = TqdmLoggingHandler()
-        handler.setFormatter(logging.Formatter("%(message)s"))
-
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="",
-            lineno=0,
-            msg="Test message",
-            args=(),
-            exc_info=None,
+    def test_emit_writes_message(self, info_record, monkeypatch):
+        written = io.StringIO()
+        monkeypatch.setattr(
+            "py_parallelizer.utils.logging.tqdm.write",
+            lambda msg, **kwargs: written.write(msg),
         )
-
-        handler.emit(record)
-        captured = capsys.readouterr()
-        assert "Test message" in captured.out
-
-    def test_raises_keyboard_interrupt(self):
         handler = TqdmLoggingHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
 
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="",
-            lineno=0,
-            msg="Test",
-            args=(),
-            exc_info=None,
-        )
+        handler.emit(info_record)
+        assert written.getvalue() == "Test message"
 
-        def mock_format(record):
-            raise KeyboardInterrupt()
+    @pytest.mark.parametrize("exc", [KeyboardInterrupt, SystemExit])
+    def test_reraises_interrupts(self, handler, info_record, monkeypatch, exc):
+        def raise_exc(record):
+            raise exc()
 
-        handler.format = mock_format
+        monkeypatch.setattr(handler, "format", raise_exc)
 
-        with pytest.raises(KeyboardInterrupt):
-            handler.emit(record)
+        with pytest.raises(exc):
+            handler.emit(info_record)
 
-    def test_raises_system_exit(self):
-        handler = TqdmLoggingHandler()
-
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="",
-            lineno=0,
-            msg="Test",
-            args=(),
-            exc_info=None,
-        )
 
-        def mock_format(record):
-            raise SystemExit()
-
-        handler.format = mock_format
-
-        with pytest.raises(SystemExit):
-            handler.emit(record)
+@pytest.fixture
+def logger_name(request):
+    """A logger name unique to the test, removed again afterwards."""
+    name = f"test_setup_logger.{request.node.name}"
+    yield name
+    logging.getLogger(name).handlers.clear()
+    logging.Logger.manager.loggerDict.pop(name, None)
 
 
 class TestSetupLogger:
-    def test_returns_logger(self):
-        logger = setup_logger("test_module")
+    def test_returns_logger(self, logger_name):
+        logger = setup_logger(logger_name)
         assert isinstance(logger, logging.Logger)
-        assert logger.name == "test_module"
+        assert logger.name == logger_name
 
-    def test_adds_tqdm_handler(self):
-        logger = setup_logger("test_module_unique_handler")
+    def test_adds_tqdm_handler(self, logger_name):
+        logger = setup_logger(logger_name)
         has_tqdm_handler = any(
             isinstance(h, TqdmLoggingHandler) for h in logger.handlers
         )
         assert has_tqdm_handler
 
-    def test_does_not_duplicate_handlers(self):
-        logger_name = "test_module_no_duplicate"
-
-        existing_logger = logging.getLogger(logger_name)
-        existing_logger.handlers.clear()
-
+    def test_does_not_duplicate_handlers(self, logger_name):
         setup_logger(logger_name)
         setup_logger(logger_name)
 